@@ -1,8 +1,9 @@
-from fastapi import FastAPI, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response
 from typing import Optional, Dict, Any, List
 import os
 import logging
+import msgspec
 from dotenv import load_dotenv
 from .redash_client import RedashClient
 
@@ -24,63 +25,108 @@ app = FastAPI(
     """,
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# Initialize Redash client
-try:
-    redash_client = RedashClient()
-except ValueError as e:
-    logger.error(f"Failed to initialize RedashClient: {str(e)}")
-    raise
+# Created at startup so the async HTTP client is bound to the running loop
+redash_client: Optional[RedashClient] = None
 
-class QueryRequest(BaseModel):
+@app.on_event("startup")
+async def startup_event():
+    """Initialize the Redash client on the running event loop."""
+    global redash_client
+    try:
+        redash_client = await RedashClient.create()
+    except ValueError as e:
+        logger.error(f"Failed to initialize RedashClient: {str(e)}")
+        raise
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP client so sockets are returned cleanly."""
+    if redash_client is not None:
+        await redash_client.aclose()
+
+class QueryRequest(msgspec.Struct):
     """
     Request model for query execution.
-    """
-    question: str = Field(..., description="Natural language question or SQL query")
-    sql_query: Optional[str] = Field(None, description="Direct SQL query to execute (optional)")
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "question": "Show me the last 10 orders",
-                "sql_query": "SELECT * FROM orders ORDER BY created_at DESC LIMIT 10"
-            }
-        }
+    Attributes:
+        question: Natural language question or SQL query
+        sql_query: Direct SQL query to execute (optional)
+    """
+    question: str
+    sql_query: Optional[str] = None
 
-class PredefinedQueryRequest(BaseModel):
+class PredefinedQueryRequest(msgspec.Struct):
     """
     Request model for predefined query execution.
+
+    Attributes:
+        parameters: Parameters to pass to the predefined query
+        max_age: Maximum age in seconds of an acceptable cached result;
+            omit to always execute fresh
     """
-    parameters: Optional[Dict[str, Any]] = Field(
-        None,
-        description="Parameters to pass to the predefined query"
-    )
+    parameters: Optional[Dict[str, Any]] = None
+    max_age: Optional[int] = None
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "parameters": {
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-12-31"
-                }
-            }
-        }
+class BatchQueryRequest(msgspec.Struct):
+    """
+    Request model for batch query execution.
+
+    Attributes:
+        queries: SQL queries to execute concurrently
+    """
+    queries: List[str]
 
-class QueryResponse(BaseModel):
+class QueryResponse(msgspec.Struct):
     """
     Response model for query results.
+
+    Attributes:
+        answer: Human-readable response message
+        sql_query: Executed SQL query
+        data: Query results data
+    """
+    answer: str
+    sql_query: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+# Struct decoders combine JSON parsing and validation in a single pass,
+# skipping Pydantic's intermediate dict step on the hot endpoints
+_query_request_decoder = msgspec.json.Decoder(QueryRequest)
+_predefined_request_decoder = msgspec.json.Decoder(PredefinedQueryRequest)
+_batch_request_decoder = msgspec.json.Decoder(BatchQueryRequest)
+
+def _json_response(content: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """Encode a msgspec struct (or list of structs) straight to JSON bytes."""
+    return Response(
+        content=msgspec.json.encode(content),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+async def _decode_body(request: Request, decoder: msgspec.json.Decoder) -> Any:
     """
-    answer: str = Field(..., description="Human-readable response message")
-    sql_query: Optional[str] = Field(None, description="Executed SQL query")
-    data: Optional[Dict[str, Any]] = Field(None, description="Query results data")
+    Decode and validate a request body with the given msgspec decoder.
+
+    Raises:
+        HTTPException: 422 if the body is malformed or fails validation
+    """
+    try:
+        return decoder.decode(await request.body())
+    except (msgspec.DecodeError, msgspec.ValidationError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 @app.get("/", status_code=status.HTTP_200_OK)
 async def root():
     """
     Root endpoint to check if the server is running.
-    
+
     Returns:
         dict: Status message
     """
@@ -94,15 +140,15 @@ async def root():
 async def get_data_sources() -> Dict[str, List[Dict[str, Any]]]:
     """
     List all available Redash data sources.
-    
+
     Returns:
         Dict[str, List[Dict[str, Any]]]: List of data sources and their configurations
-        
+
     Raises:
         HTTPException: If there's an error fetching data sources
     """
     try:
-        data_sources = redash_client.list_data_sources()
+        data_sources = await redash_client.list_data_sources()
         return {"data_sources": data_sources}
     except Exception as e:
         logger.error(f"Error getting data sources: {str(e)}")
@@ -111,37 +157,38 @@ async def get_data_sources() -> Dict[str, List[Dict[str, Any]]]:
             detail=f"Failed to fetch data sources: {str(e)}"
         )
 
-@app.post("/ask", response_model=QueryResponse, status_code=status.HTTP_200_OK)
-async def ask_question(request: QueryRequest) -> QueryResponse:
+@app.post("/ask", status_code=status.HTTP_200_OK)
+async def ask_question(raw_request: Request) -> Response:
     """
     Execute a natural language question or direct SQL query.
-    
+
     Args:
-        request (QueryRequest): Query request containing question and optional SQL
-        
+        raw_request (Request): Raw request with a QueryRequest JSON body
+
     Returns:
-        QueryResponse: Query results and metadata
-        
+        Response: Query results and metadata as a QueryResponse
+
     Raises:
         HTTPException: If query execution fails
     """
+    request = await _decode_body(raw_request, _query_request_decoder)
     try:
         # Use provided SQL or treat question as SQL (future: add NL->SQL conversion)
         sql_query = request.sql_query or request.question
         logger.info(f"Executing query: {sql_query}")
-        
+
         # Execute query
-        result = redash_client.execute_query(sql_query)
+        result = await redash_client.execute_query(sql_query)
         logger.info("Query executed successfully")
-        
+
         if not isinstance(result, dict) or "query_result" not in result:
             raise ValueError("Invalid response format from Redash")
-        
-        return QueryResponse(
+
+        return _json_response(QueryResponse(
             answer="Here are the results from your query",
             sql_query=sql_query,
             data=result["query_result"]
-        )
+        ))
     except Exception as e:
         logger.error(f"Error processing query: {str(e)}")
         raise HTTPException(
@@ -149,46 +196,116 @@ async def ask_question(request: QueryRequest) -> QueryResponse:
             detail=f"Query execution failed: {str(e)}"
         )
 
-@app.post(
-    "/ask/predefined/{query_id}",
-    response_model=QueryResponse,
-    status_code=status.HTTP_200_OK
-)
-async def ask_predefined_question(
-    query_id: int,
-    request: PredefinedQueryRequest
-) -> QueryResponse:
+@app.post("/ask/batch", status_code=status.HTTP_200_OK)
+async def ask_batch(raw_request: Request) -> Response:
+    """
+    Execute several SQL queries concurrently.
+
+    The queries are independent, so they are overlapped on the shared
+    connection pool rather than executed one after another.
+
+    Args:
+        raw_request (Request): Raw request with a BatchQueryRequest JSON body
+
+    Returns:
+        Response: Query results in input order as a list of QueryResponse
+
+    Raises:
+        HTTPException: If any query execution fails
+    """
+    request = await _decode_body(raw_request, _batch_request_decoder)
+    try:
+        results = await redash_client.execute_queries(request.queries)
+        return _json_response([
+            QueryResponse(
+                answer="Here are the results from your query",
+                sql_query=sql_query,
+                data=result["query_result"]
+            )
+            for sql_query, result in zip(request.queries, results)
+        ])
+    except Exception as e:
+        logger.error(f"Error processing batch query: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch query execution failed: {str(e)}"
+        )
+
+@app.post("/ask/predefined/{query_id}/raw", status_code=status.HTTP_200_OK)
+async def ask_predefined_question_raw(query_id: int, raw_request: Request) -> Response:
+    """
+    Execute a predefined query and stream Redash's result bytes through.
+
+    Skips all Python-side JSON decode/encode of the result payload, which
+    matters for multi-MB results. The body is Redash's query_result
+    payload rather than the QueryResponse envelope.
+
+    Args:
+        query_id (int): ID of the predefined query in Redash
+        raw_request (Request): Raw request with a PredefinedQueryRequest JSON body
+
+    Returns:
+        Response: Redash's JSON result payload, byte-for-byte
+
+    Raises:
+        HTTPException: If query execution fails
+    """
+    if await raw_request.body():
+        request = await _decode_body(raw_request, _predefined_request_decoder)
+    else:
+        request = PredefinedQueryRequest()
+    try:
+        content = await redash_client.execute_predefined_query_raw(
+            query_id, request.parameters, request.max_age
+        )
+        return Response(content=content, media_type="application/json")
+    except Exception as e:
+        logger.error(f"Error processing predefined query: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@app.post("/ask/predefined/{query_id}", status_code=status.HTTP_200_OK)
+async def ask_predefined_question(query_id: int, raw_request: Request) -> Response:
     """
     Execute a predefined query with optional parameters.
-    
+
     Args:
         query_id (int): ID of the predefined query in Redash
-        request (PredefinedQueryRequest): Optional parameters for the query
-        
+        raw_request (Request): Raw request with a PredefinedQueryRequest JSON body
+
     Returns:
-        QueryResponse: Query results and metadata
-        
+        Response: Query results and metadata as a QueryResponse
+
     Raises:
         HTTPException: If query execution fails
     """
+    if await raw_request.body():
+        request = await _decode_body(raw_request, _predefined_request_decoder)
+    else:
+        # All fields are optional, so an empty body is allowed
+        request = PredefinedQueryRequest()
     try:
         # Execute predefined query
-        result = redash_client.execute_predefined_query(query_id, request.parameters)
+        result = await redash_client.execute_predefined_query(
+            query_id, request.parameters, request.max_age
+        )
         logger.info(f"Executed predefined query {query_id}")
-        
+
         # Extract query result data
         query_result = result.get("query_result", {})
         if not query_result:
             raise ValueError("No query result in response")
-        
-        return QueryResponse(
+
+        return _json_response(QueryResponse(
             answer="Here are the results from your query",
             sql_query=query_result.get("query", ""),
             data=query_result
-        )
+        ))
     except Exception as e:
         logger.error(f"Error processing predefined query: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
-        ) 
\ No newline at end of file
+        )
@@ -1,10 +1,12 @@
 import os
-import requests
+import asyncio
+import httpx
 from typing import Dict, Any, Optional, List
 import time
+import functools
 import hashlib
 import logging
-import json
+import orjson
 from dotenv import load_dotenv
 
 # Set up logging
@@ -20,22 +22,29 @@ QUERY_STATUS = {
     'FAILED': 4
 }
 
-POLL_INTERVAL = 1  # seconds
+INITIAL_POLL_INTERVAL = 0.1  # seconds
+MAX_POLL_INTERVAL = 5.0  # seconds
+
+DATA_SOURCE_CACHE_TTL = 60  # seconds
 
 class RedashClient:
     """
     A client for interacting with the Redash API.
-    
+
     This client provides methods to:
     - List available data sources
     - Execute ad-hoc SQL queries
     - Execute predefined queries with parameters
-    
+
+    All API methods are async and share a single long-lived HTTP client with
+    connection pooling, so concurrent requests reuse the same TCP/TLS
+    connections instead of paying a handshake per call.
+
     Attributes:
         base_url (str): The base URL of the Redash instance
         api_key (str): API key for authentication
         data_source_id (int): Default data source ID for queries
-        headers (Dict[str, str]): HTTP headers for API requests
+        headers (httpx.Headers): Pre-normalized HTTP headers for API requests
     """
 
     def __init__(self):
@@ -43,82 +52,151 @@ class RedashClient:
         self.base_url = os.getenv("REDASH_BASE_URL")
         self.api_key = os.getenv("REDASH_API_KEY")
         self.data_source_id = int(os.getenv("REDASH_DATA_SOURCE_ID", "6"))
-        
+
         if not all([self.base_url, self.api_key]):
             raise ValueError("Missing required environment variables: REDASH_BASE_URL or REDASH_API_KEY")
-        
-        self.headers = {
+
+        # Pre-normalized once here; the shared client merges them at
+        # connection setup rather than per call
+        self.headers = httpx.Headers({
             "Authorization": f"Key {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        logger.info(f"Initialized RedashClient with base_url: {self.base_url}")
+            "Content-Type": "application/json",
+            # Result payloads are highly compressible JSON; httpx
+            # decompresses transparently
+            "Accept-Encoding": "gzip, br"
+        })
+        self._client: Optional[httpx.AsyncClient] = None
+        self._ds_cache: Optional[List[Dict[str, Any]]] = None
+        self._ds_cache_exp = 0.0
+        self._ds_cache_lock = asyncio.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        logger.info("Initialized RedashClient with base_url: %s", self.base_url)
+
+    @classmethod
+    async def create(cls) -> "RedashClient":
+        """
+        Construct a client with its shared HTTP client opened.
+
+        Call from the FastAPI startup event (or any running event loop) so
+        the httpx.AsyncClient is bound to the loop that will use it.
 
-    def list_data_sources(self) -> List[Dict[str, Any]]:
+        Returns:
+            RedashClient: A fully initialized client
+        """
+        client = cls()
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url,
+            headers=client.headers,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+            timeout=30.0
+        )
+        return client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client. Call once from the FastAPI shutdown event."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def list_data_sources(self) -> List[Dict[str, Any]]:
         """
         Retrieve all available data sources from Redash.
-        
+
+        Data sources change rarely, so results are cached in memory for
+        DATA_SOURCE_CACHE_TTL seconds. Concurrent cache misses are
+        deduplicated behind a lock so only one request hits Redash.
+
         Returns:
             List[Dict[str, Any]]: List of data source configurations
-            
+
         Raises:
-            requests.exceptions.RequestException: If the API request fails
+            httpx.HTTPError: If the API request fails
         """
-        url = f"{self.base_url}/api/data_sources"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        if self._ds_cache is not None and time.monotonic() < self._ds_cache_exp:
+            return self._ds_cache
 
-    def _get_query_hash(self, query: str) -> str:
+        async with self._ds_cache_lock:
+            # Another task may have refreshed the cache while we waited
+            if self._ds_cache is not None and time.monotonic() < self._ds_cache_exp:
+                return self._ds_cache
+
+            response = await self._client.get("/api/data_sources")
+            response.raise_for_status()
+            self._ds_cache = orjson.loads(response.content)
+            self._ds_cache_exp = time.monotonic() + DATA_SOURCE_CACHE_TTL
+            return self._ds_cache
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_query_hash(query: str) -> str:
         """
-        Generate a unique MD5 hash for a query string.
-        
+        Generate a short unique hash for a query string.
+
+        The hash only names the generated Redash query, so a fast
+        non-cryptographic digest (blake2b) is used instead of MD5.
+        Memoized, since dashboards and integrations often re-submit the
+        same SQL and hashing long queries is O(n).
+
         Args:
             query (str): SQL query string
-            
+
         Returns:
-            str: MD5 hash of the query
+            str: blake2b hash of the query
         """
-        return hashlib.md5(query.encode()).hexdigest()
+        return hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
 
-    def _poll_job_status(self, job_id: str) -> Dict[str, Any]:
+    async def _poll_job_status(self, job_id: str) -> Dict[str, Any]:
         """
         Poll the status of a query job until completion or failure.
-        
+
+        Polling starts at a short interval and backs off exponentially, so
+        short queries return quickly while long queries cost few HTTP
+        round trips.
+
         Args:
             job_id (str): ID of the job to poll
-            
+
         Returns:
             Dict[str, Any]: Job status data including result ID
-            
+
         Raises:
             Exception: If the query execution fails
         """
+        # Built once; the loop can iterate many times for long queries
+        url = f"/api/jobs/{job_id}"
+        delay = INITIAL_POLL_INTERVAL
         while True:
-            job_status = requests.get(f"{self.base_url}/api/jobs/{job_id}", headers=self.headers)
+            job_status = await self._client.get(url)
             job_status.raise_for_status()
-            status_data = job_status.json()
-            logger.debug(f"Job status: {json.dumps(status_data, indent=2)}")
-            
+            status_data = orjson.loads(job_status.content)
+            logger.debug("Job status: %s", status_data)
+
             status = status_data["job"]["status"]
             if status == QUERY_STATUS['COMPLETED']:
                 return status_data["job"]
             elif status == QUERY_STATUS['FAILED']:
                 error = status_data["job"].get("error", "Unknown error")
                 raise Exception(f"Query execution failed: {error}")
-            
-            time.sleep(POLL_INTERVAL)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_POLL_INTERVAL)
 
     def _format_query_result(self, result: Dict[str, Any], query: str) -> Dict[str, Any]:
         """
         Format the query result into a standardized structure.
-        
+
+        The parsed query_result dict is passed through rather than rebuilt,
+        so large column/row payloads are never walked or re-wrapped here --
+        only the final response serialization touches the rows.
+
         Args:
             result (Dict[str, Any]): Raw query result from Redash
             query (str): Original SQL query
-            
+
         Returns:
             Dict[str, Any]: Formatted query result
-            
+
         Raises:
             Exception: If the result format is invalid
         """
@@ -126,37 +204,81 @@ class RedashClient:
         query_result = result.get("query_result", result)
         if not query_result:
             raise Exception("No query result in response")
-            
-        return {
-            "query_result": {
-                "id": query_result.get("id"),
-                "query": query or query_result.get("query", ""),
-                "data": {
-                    "columns": query_result.get("data", {}).get("columns", []),
-                    "rows": query_result.get("data", {}).get("rows", [])
-                },
-                "data_source_id": query_result.get("data_source_id"),
-                "runtime": query_result.get("runtime", 0),
-                "retrieved_at": query_result.get("retrieved_at")
-            }
-        }
 
-    def execute_query(self, query: str, data_source_id: Optional[int] = None) -> Dict[str, Any]:
+        # Normalize the few fields callers rely on, in place. Guarded
+        # assignments avoid allocating throwaway defaults on the hot path
+        query_result["query"] = query or query_result.get("query", "")
+        if "runtime" not in query_result:
+            query_result["runtime"] = 0
+        data = query_result.get("data")
+        if data is None:
+            data = query_result["data"] = {}
+        if "columns" not in data:
+            data["columns"] = []
+        if "rows" not in data:
+            data["rows"] = []
+
+        return {"query_result": query_result}
+
+    async def execute_query(self, query: str, data_source_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Execute an ad-hoc SQL query on Redash.
-        
+
+        Identical queries already in flight are deduplicated: the second
+        caller awaits the first caller's result instead of creating and
+        running a duplicate Redash query.
+
         Args:
             query (str): SQL query to execute
             data_source_id (Optional[int]): Data source ID to use, defaults to instance default
-            
+
         Returns:
             Dict[str, Any]: Query results in standardized format
-            
+
         Raises:
             Exception: If query creation or execution fails
         """
         data_source_id = data_source_id or self.data_source_id
-        
+        key = f"{data_source_id}:{self._get_query_hash(query)}"
+
+        if key in self._inflight:
+            logger.info("Duplicate in-flight query, awaiting existing execution")
+            return await self._inflight[key]
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._execute_query(query, data_source_id)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so asyncio doesn't warn when no duplicate waiter exists
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+            # If the leader was cancelled (e.g. client disconnect),
+            # CancelledError bypasses the except arm above; cancel the
+            # future so duplicate waiters aren't left pending forever
+            if not future.done():
+                future.cancel()
+
+    async def _execute_query(self, query: str, data_source_id: int) -> Dict[str, Any]:
+        """
+        Create and run an ad-hoc query on Redash.
+
+        Args:
+            query (str): SQL query to execute
+            data_source_id (int): Data source ID to use
+
+        Returns:
+            Dict[str, Any]: Query results in standardized format
+
+        Raises:
+            Exception: If query creation or execution fails
+        """
         try:
             # Create new query
             query_data = {
@@ -164,18 +286,19 @@ class RedashClient:
                 "data_source_id": data_source_id,
                 "name": f"MCP Query - {self._get_query_hash(query)[:8]}"
             }
-            response = requests.post(f"{self.base_url}/api/queries", json=query_data, headers=self.headers)
+            response = await self._client.post("/api/queries", json=query_data)
             response.raise_for_status()
-            query_id = response.json()["id"]
-            logger.info(f"Created query ID: {query_id}")
+            query_id = orjson.loads(response.content)["id"]
+            logger.info("Created query ID: %s", query_id)
 
             # Execute query
-            job_response = requests.post(f"{self.base_url}/api/queries/{query_id}/results", headers=self.headers)
+            job_response = await self._client.post(f"/api/queries/{query_id}/results")
             job_response.raise_for_status()
-            
-            job_data = job_response.json()
-            logger.info(f"Job response data: {json.dumps(job_data, indent=2)}")
-            
+
+            job_data = orjson.loads(job_response.content)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Job response data: %s", job_data)
+
             # Handle both immediate results and job-based results
             if "query_result" in job_data:
                 # Query result is already available
@@ -185,66 +308,159 @@ class RedashClient:
                 # Need to wait for job completion
                 logger.info("Waiting for job completion")
                 job_id = job_data["job"]["id"]
-                logger.info(f"Started job ID: {job_id}")
+                logger.info("Started job ID: %s", job_id)
 
                 # Wait for completion
-                job_result = self._poll_job_status(job_id)
+                job_result = await self._poll_job_status(job_id)
                 result_id = job_result["query_result_id"]
 
                 # Fetch results
-                result_response = requests.get(f"{self.base_url}/api/query_results/{result_id}", headers=self.headers)
+                result_response = await self._client.get(f"/api/query_results/{result_id}")
                 result_response.raise_for_status()
-                result_data = result_response.json()
-                logger.info(f"Result data: {json.dumps(result_data, indent=2)}")
-                
+                result_data = orjson.loads(result_response.content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Result data: %s", result_data)
+
                 return self._format_query_result(result_data, query)
             else:
                 raise Exception(f"Invalid response format. Keys: {list(job_data.keys())}")
-            
+
         except Exception as e:
-            logger.error(f"Error executing query: {str(e)}")
+            logger.error("Error executing query: %s", e)
             raise
 
-    def execute_predefined_query(self, query_id: int, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def execute_queries(self, queries: List[str], data_source_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Execute several ad-hoc SQL queries concurrently.
+
+        The queries are independent of each other, so they are overlapped
+        with asyncio.gather on the shared connection pool (multiplexed over
+        HTTP/2) instead of paying one round-trip sequence per query.
+
+        Args:
+            queries (List[str]): SQL queries to execute
+            data_source_id (Optional[int]): Data source ID to use, defaults to instance default
+
+        Returns:
+            List[Dict[str, Any]]: Query results in standardized format, in input order
+
+        Raises:
+            Exception: If any query creation or execution fails
+        """
+        return await asyncio.gather(
+            *(self.execute_query(query, data_source_id) for query in queries)
+        )
+
+    async def execute_predefined_query(self, query_id: int, parameters: Optional[Dict[str, Any]] = None,
+                                       max_age: Optional[int] = None) -> Dict[str, Any]:
         """
         Execute a predefined query with optional parameters.
-        
+
+        When max_age is given, Redash may answer with a cached query_result
+        inline in the first response, collapsing the job-and-poll round
+        trips into a single request for recently executed queries.
+
         Args:
             query_id (int): ID of the predefined query
             parameters (Optional[Dict[str, Any]]): Parameters to pass to the query
-            
+            max_age (Optional[int]): Maximum age in seconds of an acceptable
+                cached result; omit to always execute fresh
+
         Returns:
             Dict[str, Any]: Query results in standardized format
-            
+
         Raises:
             Exception: If query execution fails
         """
         try:
             # Execute query with parameters
             job_data = {"parameters": parameters} if parameters else {}
-            job_response = requests.post(
-                f"{self.base_url}/api/queries/{query_id}/results",
-                json=job_data,
-                headers=self.headers
+            if max_age is not None:
+                job_data["max_age"] = max_age
+            job_response = await self._client.post(
+                f"/api/queries/{query_id}/results",
+                json=job_data
             )
             job_response.raise_for_status()
-            
-            if "job" not in job_response.json():
-                raise Exception(f"Invalid response format: {job_response.json()}")
-                
-            job_id = job_response.json()["job"]["id"]
-            logger.info(f"Started job ID: {job_id}")
+            payload = orjson.loads(job_response.content)
+
+            if "query_result" in payload:
+                # Cached result delivered inline, no job to poll
+                logger.info("Got cached query result")
+                return self._format_query_result(payload, "")
+
+            if "job" not in payload:
+                raise Exception(f"Invalid response format: {payload}")
+
+            job_id = payload["job"]["id"]
+            logger.info("Started job ID: %s", job_id)
 
             # Wait for completion
-            job_result = self._poll_job_status(job_id)
+            job_result = await self._poll_job_status(job_id)
             result_id = job_result["query_result_id"]
 
             # Fetch results
-            result_response = requests.get(f"{self.base_url}/api/query_results/{result_id}", headers=self.headers)
+            result_response = await self._client.get(f"/api/query_results/{result_id}")
+            result_response.raise_for_status()
+
+            return self._format_query_result(orjson.loads(result_response.content), "")
+
+        except Exception as e:
+            logger.error("Error executing predefined query: %s", e)
+            raise
+
+    async def execute_predefined_query_raw(self, query_id: int, parameters: Optional[Dict[str, Any]] = None,
+                                           max_age: Optional[int] = None) -> bytes:
+        """
+        Execute a predefined query and return Redash's result payload unparsed.
+
+        The large result body is passed through as bytes: it is never
+        decoded or re-encoded in Python, so multi-MB results skip two full
+        (de)serializations compared to the standard path.
+
+        Args:
+            query_id (int): ID of the predefined query
+            parameters (Optional[Dict[str, Any]]): Parameters to pass to the query
+            max_age (Optional[int]): Maximum age in seconds of an acceptable
+                cached result; omit to always execute fresh
+
+        Returns:
+            bytes: Redash's JSON result payload, byte-for-byte
+
+        Raises:
+            Exception: If query execution fails
+        """
+        try:
+            job_data = {"parameters": parameters} if parameters else {}
+            if max_age is not None:
+                job_data["max_age"] = max_age
+            job_response = await self._client.post(
+                f"/api/queries/{query_id}/results",
+                json=job_data
+            )
+            job_response.raise_for_status()
+            payload = orjson.loads(job_response.content)
+
+            if "query_result" in payload:
+                # Cached result delivered inline, already the final payload
+                logger.info("Got cached query result")
+                return job_response.content
+
+            if "job" not in payload:
+                raise Exception(f"Invalid response format: {payload}")
+
+            job_id = payload["job"]["id"]
+            logger.info("Started job ID: %s", job_id)
+
+            # Wait for completion
+            job_result = await self._poll_job_status(job_id)
+            result_id = job_result["query_result_id"]
+
+            # Fetch results, leaving the body unparsed
+            result_response = await self._client.get(f"/api/query_results/{result_id}")
             result_response.raise_for_status()
-            
-            return self._format_query_result(result_response.json(), "")
-            
+            return result_response.content
+
         except Exception as e:
-            logger.error(f"Error executing predefined query: {str(e)}")
-            raise 
\ No newline at end of file
+            logger.error("Error executing predefined query: %s", e)
+            raise